@@ -14,22 +14,90 @@
 
 # Import required libraries
 from selenium import webdriver
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import NoSuchWindowException, WebDriverException
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.action_chains import ActionChains
 from dataclasses import dataclass
 from typing import List
-import time
+import numpy as np
+import base64
+import mimetypes
 import os
-import re
+
+# Script to fill the x-axis-p2 and y-axis-p2 inputs and notify the app of the change.
+# The native value setter is used so framework-controlled inputs pick up the new value.
+SET_AXES_VALUES_JS = """
+const setValue = Object.getOwnPropertyDescriptor(HTMLInputElement.prototype, 'value').set;
+[['x-axis-p2', arguments[0]], ['y-axis-p2', arguments[1]]].forEach(([id, value]) => {
+    const input = document.getElementById(id);
+    setValue.call(input, value);
+    input.dispatchEvent(new Event('input', {bubbles: true}));
+    input.dispatchEvent(new Event('change', {bubbles: true}));
+});
+"""
+
+# Script to click each [dx, dy] offset from the image's top-left corner in order, dispatching
+# the pointer and mouse events a real click would produce on the element under it.
+# The image rectangle is re-read before every click, so clicks follow the image if the app moves it.
+# Whatever is topmost at the point receives the click (e.g. a marker drawn over the image),
+# but a point outside the image's rectangle or outside the viewport is an error.
+CLICK_POINTS_JS = """
+const image = arguments[1];
+for (const [dx, dy] of arguments[0]) {
+    const r = image.getBoundingClientRect();
+    const x = r.left + dx;
+    const y = r.top + dy;
+    const el = document.elementFromPoint(x, y);
+    if (x < r.left || x > r.right || y < r.top || y > r.bottom || !el) {
+        throw new Error(`Point (${x}, ${y}) is not on the uploaded image`);
+    }
+    const init = {clientX: x, clientY: y, bubbles: true, cancelable: true, view: window};
+    el.dispatchEvent(new PointerEvent('pointerdown', init));
+    el.dispatchEvent(new MouseEvent('mousedown', init));
+    el.dispatchEvent(new PointerEvent('pointerup', init));
+    el.dispatchEvent(new MouseEvent('mouseup', init));
+    el.dispatchEvent(new MouseEvent('click', init));
+}
+"""
+
+# Script to scroll the uploaded image into view and return it with its client rectangle
+# and border width, or null while the image has not been inserted and loaded yet.
+FIND_IMAGE_JS = """
+const e = document.querySelector('.uploaded-image');
+if (!e || !e.complete || !e.naturalWidth) return null;
+e.scrollIntoView({block: 'center', inline: 'center'});
+const r = e.getBoundingClientRect();
+const b = parseInt(getComputedStyle(e).borderTopWidth) || 0;
+return {element: e, x: r.left, y: r.top, width: r.width, height: r.height, border: b};
+"""
+
+# Script to put a base64-encoded file into a file input and notify the app of the change.
+UPLOAD_IMAGE_JS = """
+const [input, b64, name, type] = arguments;
+const bytes = Uint8Array.from(atob(b64), c => c.charCodeAt(0));
+const dt = new DataTransfer();
+dt.items.add(new File([bytes], name, {type: type}));
+input.files = dt.files;
+input.dispatchEvent(new Event('change', {bubbles: true}));
+"""
+
+# Script to replace the page's alert and confirm dialogs with no-ops that never block.
+DISABLE_DIALOGS_JS = """
+window.alert = function() {};
+window.confirm = function() { return true; };
+"""
 
 # ----------------------------------------
 # Define the ImageAutomation class
 # ----------------------------------------
 class ImageAutomation:
-    def __init__(self, driver_path, web_address, originalImageObj):
+    # Chrome sessions shared by all instances, keyed by ChromeDriver path and headless mode
+    _drivers = {}
+
+    def __init__(self, driver_path, web_address, originalImageObj, interactive=False):
         """
     Initialize class attributes.
 
@@ -40,20 +108,22 @@ class ImageAutomation:
                                  the pic_name, image_width, and original_axes_points.
         
         original_axes_points itself contains xAxis_point1, xAxis_point2, yAxis_point1, and yAxis_point2.
+        interactive (bool): If True, show the browser and keep the tab open until the user presses Enter.
     """
         
         self.driver_path = driver_path
         self.web_address = web_address
+        self.interactive = interactive
         
         self.pic_name = originalImageObj.pic_name
         self.original_image_width = originalImageObj.image_width
         
         # Set the axes points
-        self.original_axes_points = [
-            (x := point.x, y := point.y) 
+        self.original_axes_points = np.asarray([
+            [point.x, point.y] 
             for point in [originalImageObj.xAxis_point1, originalImageObj.xAxis_point2, 
                           originalImageObj.yAxis_point1, originalImageObj.yAxis_point2]
-        ]
+        ], dtype=np.float64)
         
         
         # Set the axes values:
@@ -64,10 +134,10 @@ class ImageAutomation:
         
         
         # Set the coordinates of the points to be clicked
-        self.clickedPoints = [
-            (x := point.x, y := point.y) 
+        self.clickedPoints = np.asarray([
+            [point.x, point.y] 
             for point in originalImageObj.clickedPoints
-        ]
+        ], dtype=np.float64).reshape(-1, 2)
         
         
         self.driver = None
@@ -75,55 +145,27 @@ class ImageAutomation:
         self.image_location = None
         self.image_size = None
         self.border_size = None
+        
+        # Affine map from original pixels to offsets from the image's top-left corner, set once the image is found
+        self._A = None
+        self._b = None
 
     # -------------------------------------------------------------
     # Method to upload an image using the provided file input element and image path
     # -------------------------------------------------------------
     def upload_image(self, file_input_element, pic_full_path):
         """
-        Upload an image to the file input element.
+        Upload an image to the file input element by injecting it as a File through DataTransfer.
         
         Args:
             file_input_element (WebElement): The file input element to upload the image to.
             pic_full_path (str): The full path of the image file to upload.
         """
-        file_input_element.send_keys(pic_full_path)
-
-    # -------------------------------------------------------------
-    # Method to accept the alert that appears after uploading an image
-    # -------------------------------------------------------------
-    def accept_alert(self):
-        """
-        Accept the alert that appears after uploading an image.
-        """
-        alert = WebDriverWait(self.driver, 10).until(EC.alert_is_present())
-        self.driver.switch_to.alert.accept()
-
-    # -------------------------------------------------------------
-    # Method to convert the original coordinates to the current coordinates based on the image dimensions and border size
-    # -------------------------------------------------------------
-    def convert_original_coor_to_current(self, original_coor, original_image_width, image_location, image_size, border_size):
-        """
-        Convert the original coordinates to the current coordinates.
-        
-        Args:
-            original_coor (tuple): The original coordinates (x, y).
-            original_image_width (int): The width of the original image.
-            image_location (dict): The location of the image element.
-            image_size (dict): The size of the image element.
-            border_size (int): The size of the image border.
-
-        Returns:
-            x (float): The x-coordinate of the current position.
-            y (float): The y-coordinate of the current position.
-        """
-
-        aspect_ratio = (image_size['width'] - 2 * border_size) / original_image_width
-        X0 = original_coor[0]
-        Y0 = original_coor[1]
-        x = (X0 - 1) * aspect_ratio - image_size['width'] // 2 + 1 + border_size
-        y = (Y0 - 1) * aspect_ratio - image_size['height'] // 2 + 1 + border_size
-        return x, y
+        with open(pic_full_path, "rb") as pic_file:
+            pic_b64 = base64.b64encode(pic_file.read()).decode()
+        mime_type = mimetypes.guess_type(pic_full_path)[0] or "image/jpeg"
+        self.driver.execute_script(UPLOAD_IMAGE_JS, file_input_element, pic_b64,
+                                   os.path.basename(pic_full_path), mime_type)
 
     # -------------------------------------------------------------
     # Method to find the image element, location, size, and border size
@@ -132,13 +174,18 @@ class ImageAutomation:
         """
         Find the image element, location, size, and border size.
         """
-        self.image_element = self.driver.find_element(By.CLASS_NAME, "uploaded-image")
-        self.image_location = self.image_element.location
-        self.image_size = self.image_element.size
-        border_style = self.image_element.value_of_css_property("border")
-        match = re.search(r'\b(\d+)px\b', border_style)
-        if match:
-            self.border_size = int(match.group(1))
+        data = WebDriverWait(self.driver, 10, poll_frequency=0.05).until(
+            lambda driver: driver.execute_script(FIND_IMAGE_JS)
+        )
+        self.image_element = data['element']
+        self.image_location = {'x': data['x'], 'y': data['y']}
+        self.image_size = {'width': data['width'], 'height': data['height']}
+        self.border_size = data['border']
+        
+        # Building the affine map once: offset = (original - 1) * aspect_ratio + 1 + border
+        aspect_ratio = (self.image_size['width'] - 2 * self.border_size) / self.original_image_width
+        self._A = np.array([[aspect_ratio, 0.0], [0.0, aspect_ratio]])
+        self._b = np.full(2, 1 + self.border_size - aspect_ratio)
 
     # -------------------------------------------------------------
     # Method to perform the actions on the image element, including moving to coordinates, clicking, and setting axis values
@@ -147,67 +194,165 @@ class ImageAutomation:
         """
         Perform actions on the image element.
         """
-        actions = ActionChains(self.driver)
+        # Converting the coordinate points and the required points to offsets within the image:
+        axes_offsets = (self.original_axes_points @ self._A + self._b).tolist()
+        point_offsets = (self.clickedPoints @ self._A + self._b).tolist()
         
-        #Clicking on the coordinate points:
-        for coor in self.original_axes_points:
-            x, y = self.convert_original_coor_to_current(coor, self.original_image_width, self.image_location, self.image_size, self.border_size)
-            actions.move_to_element(self.image_element).move_by_offset(x, y).click().perform()
+        #Clicking on the coordinate points in a single script call:
+        self.driver.execute_script(CLICK_POINTS_JS, axes_offsets, self.image_element)
         
-        # Defining the axes values:
+        # Defining the axes values in a single script call:
+        self.driver.execute_script(SET_AXES_VALUES_JS, f"{self.xAxisValue_p2}", f"{self.yAxisValue_p2}")
+        
+        #Clicking on the required points in a single script call:
+        self.driver.execute_script(CLICK_POINTS_JS, point_offsets, self.image_element)
         
-        x_axis_p2 = self.driver.find_element(By.ID, "x-axis-p2")
-        x_axis_p2.clear()
-        x_axis_p2.send_keys(f"{self.xAxisValue_p2}")
 
-        y_axis_p2 = self.driver.find_element(By.ID, "y-axis-p2")
-        y_axis_p2.clear()
-        y_axis_p2.send_keys(f"{self.yAxisValue_p2}")
+    # -------------------------------------------------------------
+    # Class methods to share one Chrome session across runs
+    # -------------------------------------------------------------
+    @classmethod
+    def acquire_driver(cls, driver_path, headless=False):
+        """
+        Return the shared Chrome driver for the given path, starting it on first use.
         
-        #Clicking on the required points:
-        for coor in self.clickedPoints:
-            x, y = self.convert_original_coor_to_current(coor, self.original_image_width, self.image_location, self.image_size, self.border_size)
-            actions.move_to_element(self.image_element).move_by_offset(x, y).click().perform()
+        Args:
+            driver_path (str): The path to the ChromeDriver executable.
+            headless (bool): If True, run Chrome without a window, GPU, or extensions.
+
+        Returns:
+            driver (WebDriver): The shared Chrome driver.
+        """
+        key = (driver_path, headless)
+        driver = cls._drivers.get(key)
+        if driver is None:
+            # The app is usable once the DOM is ready, so don't wait for every subresource
+            options = webdriver.ChromeOptions()
+            options.page_load_strategy = 'eager'
+            if headless:
+                # Images stay enabled: the uploaded plot must render to be measured and clicked
+                for argument in ["--headless=new", "--disable-gpu", "--disable-extensions",
+                                 "--no-sandbox", "--window-size=1920,1080"]:
+                    options.add_argument(argument)
+            # Selenium 4 drivers reuse one keep-alive HTTP connection for every command
+            driver = webdriver.Chrome(service=Service(driver_path), options=options)
+            if not headless:
+                driver.maximize_window()
+            cls._drivers[key] = driver
+        return driver
+
+    @classmethod
+    def open_tab(cls, driver_path, headless=False):
+        """
+        Open a new tab in the shared Chrome driver, replacing the driver if its session has died.
+        
+        Args:
+            driver_path (str): The path to the ChromeDriver executable.
+            headless (bool): If True, run Chrome without a window, GPU, or extensions.
+
+        Returns:
+            driver (WebDriver): The shared Chrome driver, switched to the new tab.
+        """
+        driver = cls.acquire_driver(driver_path, headless)
+        try:
+            try:
+                driver.switch_to.new_window('tab')
+            except NoSuchWindowException:
+                # The current tab was closed by hand: move to one still open and retry
+                driver.switch_to.window(driver.window_handles[0])
+                driver.switch_to.new_window('tab')
+        except (WebDriverException, IndexError):
+            # The pooled session died since the last run: start a fresh browser instead
+            cls.discard_driver(driver)
+            driver = cls.acquire_driver(driver_path, headless)
+            driver.switch_to.new_window('tab')
+        return driver
+
+    @classmethod
+    def release_tab(cls, driver):
+        """
+        Close the current tab and switch to one still open, discarding the driver if its session has died.
         
+        Args:
+            driver (WebDriver): The pooled Chrome driver whose current tab should be closed.
+        """
+        try:
+            try:
+                driver.close()
+            except NoSuchWindowException:
+                # The tab was already closed by hand; the session itself is still usable
+                pass
+            driver.switch_to.window(driver.window_handles[0])
+        except (WebDriverException, IndexError):
+            # No session or no open window is left: drop it so the next run starts a new browser
+            cls.discard_driver(driver)
+
+    @classmethod
+    def discard_driver(cls, driver):
+        """
+        Remove a driver from the pool and quit it, ignoring errors from a dead session.
+        
+        Args:
+            driver (WebDriver): The pooled Chrome driver to discard.
+        """
+        for key, pooled in list(cls._drivers.items()):
+            if pooled is driver:
+                del cls._drivers[key]
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+    @classmethod
+    def shutdown(cls):
+        """
+        Quit all shared Chrome drivers.
+        """
+        for driver in list(cls._drivers.values()):
+            cls.discard_driver(driver)
 
     # -------------------------------------------------------------
     # Method to run the image automation process
     # -------------------------------------------------------------
     def run(self):
         """
-        Run the image automation process.
+        Run the image automation process in a new tab of the shared browser.
         """
-        self.driver = webdriver.Chrome(self.driver_path)
-        self.driver.get(self.web_address)
-        self.driver.maximize_window()
-        time.sleep(1)
-
-        # Find the file input element and upload the image
-        file_input = self.driver.find_element(By.ID, "file-upload")
-        current_dir = os.getcwd()
-        pic_path = os.path.join(current_dir, self.pic_name)
-        self.upload_image(file_input, pic_path)
-        self.accept_alert()
-
-        # Find the image element and perform the actions
-        self.find_image_element()
-        self.perform_actions()
-
-        # Print the image location, size, and border size
-        print("Location:", self.image_location)
-        print("Size:", self.image_size)
-        print("borderSize:", self.border_size)
-
-        # Wait for the user to press Enter before closing the browser
-        input("Press Enter to close the browser...")
-        self.driver.quit()
-
-@dataclass
+        self.driver = self.open_tab(self.driver_path, headless=not self.interactive)
+        try:
+            self.driver.get(self.web_address)
+            self.driver.execute_script(DISABLE_DIALOGS_JS)
+
+            # Wait for the file input element and upload the image
+            file_input = WebDriverWait(self.driver, 10).until(
+                EC.presence_of_element_located((By.ID, "file-upload"))
+            )
+            current_dir = os.getcwd()
+            pic_path = os.path.join(current_dir, self.pic_name)
+            self.upload_image(file_input, pic_path)
+
+            # Find the image element and perform the actions
+            self.find_image_element()
+            self.perform_actions()
+
+            # Print the image location (relative to the viewport), size, and border size
+            print("Viewport location:", self.image_location)
+            print("Size:", self.image_size)
+            print("borderSize:", self.border_size)
+
+            # In interactive mode, wait for the user to press Enter before closing the tab
+            if self.interactive:
+                input("Press Enter to close the tab...")
+        finally:
+            # Close only this tab, keeping the browser alive for later runs
+            self.release_tab(self.driver)
+
+@dataclass(slots=True)
 class Point:
     x: float
     y: float
 
-@dataclass
+@dataclass(slots=True)
 class UploadedImage:
     pic_name: str
     image_width: int
@@ -275,8 +420,11 @@ if __name__ == "__main__":
 
     # Create an instance of the ImageAutomation class and run the automation process
     #image_automation = ImageAutomation(chrome_driver_path, web_address, pic_name, original_image_width, original_axes_points)
-    image_automation = ImageAutomation(chrome_driver_path, web_address, originalImageObj)
-    image_automation.run()
+    image_automation = ImageAutomation(chrome_driver_path, web_address, originalImageObj, interactive=True)
+    try:
+        image_automation.run()
+    finally:
+        ImageAutomation.shutdown()
 
 # -------------------------------------------------------------
 # End of the script